@@ -2,7 +2,7 @@ import asyncio
 from typing import List
 from openai.types.responses import ResponseInputParam
 from ..core.config import env_settings
-from ..services.llm_service import llm_service
+from ..services.llm_service import ARTICLE_ANALYSIS_MAX_CONCURRENCY, llm_service
 from ..models.analysis_schema import (
     ArticleAnalysisInput,
     ArticleAnalysisOutput,
@@ -16,7 +16,7 @@ async def analyze_articles(
 ) -> List[ArticleAnalysisResult]:
     """
     This function takes in a list of LLM-ready article inputs, and runs the
-    article analysis for each article concurrently with a limit of 4 concurrent requests.
+    article analysis for each article concurrently, with a limit on concurrent requests.
     The article analysis involves invoking the LLM with appropriate prompts and input,
     and also running guardrail checks on the generated analysis to ensure quality and
     integrity of the analysis.
@@ -27,12 +27,16 @@ async def analyze_articles(
     Returns:
         A list of article analysis outputs from LLM.
     """
-    # Default value is 2. This has been set using the formula: Floor[(No. of Article Analysis Models)/2]
-    # In this case, we have 5 models hence a value of Floor(5/2) = 2 is good.
-    # This ensures there are models free while others are working, giving us time to cool off their
-    # rate-limit.
-    semaphore = asyncio.Semaphore(env_settings.MAX_CONCURRENT_LLM_CALLS)
+    # Unless MAX_CONCURRENT_LLM_CALLS overrides it, the limit is the sum of the per-model
+    # request slots of the article analysis models. Within this limit, the LLM service
+    # spreads the requests over the models and caps the concurrent requests per model,
+    # so all the models work in parallel while none exceeds its TPM budget.
+    semaphore = asyncio.Semaphore(
+        env_settings.MAX_CONCURRENT_LLM_CALLS or ARTICLE_ANALYSIS_MAX_CONCURRENCY
+    )
 
+    # LLM failures (including fail-fast ones) come back as None from the LLM service,
+    # hence those articles are simply skipped.
     results = await asyncio.gather(
         *[run_article_analysis(a, semaphore) for a in articles]
     )
@@ -6,6 +6,7 @@ from ..analyzer.gap_analysis import run_gap_analysis
 from ..analyzer.article_analysis import analyze_articles
 from ..services.sheet_service import (
     update_google_sheets,
+    update_google_sheets_batch,
 )
 from ..utils.sheet_utils import (
     flatten_articles_catalogue,
@@ -14,6 +15,7 @@ from ..utils.sheet_utils import (
     flatten_gap_analysis_result,
 )
 from ..utils.mapping_utils import (
+    build_analysis_map,
     generate_gap_analysis_input,
     normalize_analyzed_articles_to_catalogue,
     normalize_scraped_articles,
@@ -72,8 +74,9 @@ async def run_pipeline(
 
         # Normalize analyzed data and initial normalized article data into a structure fit for
         # spreadsheet display.
+        analysis_map = build_analysis_map(article_analysis_result)
         articles_catalogue = normalize_analyzed_articles_to_catalogue(
-            analyzed_articles=article_analysis_result, articles=normalized_articles
+            analysis_map=analysis_map, articles=normalized_articles
         )
 
         # Flatten normalized data into dicts and update spreadsheet.
@@ -115,15 +118,14 @@ async def run_pipeline(
             flattened_competitor_analysis_insights = flatten_competitor_analysis_insights(
                 competitor_analysis_result
             )
+            # Both sheets are written together, sharing one styling and one values
+            # batch update instead of two of each.
             await run_in_threadpool(
-                update_google_sheets,
-                flattened_competitor_comparison,
-                "Competitor Comparison",
-            )
-            await run_in_threadpool(
-                update_google_sheets,
-                flattened_competitor_analysis_insights,
-                "Strategic Insights & Recommendations",
+                update_google_sheets_batch,
+                {
+                    "Competitor Comparison": flattened_competitor_comparison,
+                    "Strategic Insights & Recommendations": flattened_competitor_analysis_insights,
+                },
             )
         except Exception as e:
             print(f"Error occurred in Competitor Analysis: {str(e)}")
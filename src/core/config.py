@@ -8,7 +8,8 @@ class Settings(BaseSettings):
     # LLM
     GROQ_API_KEY: str
     GROQ_BASE_URL: str = "https://api.groq.com/openai/v1"
-    MAX_CONCURRENT_LLM_CALLS: int = 2
+    # Concurrent article analyses, defaults to the total per-model request slots.
+    MAX_CONCURRENT_LLM_CALLS: int | None = None
     # Google Sheets
     GOOGLE_CREDS_JSON: str
     SHEET_ID: str
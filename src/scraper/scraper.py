@@ -1,6 +1,6 @@
 import asyncio
 import httpx
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 from typing import List
 from bs4 import BeautifulSoup, Tag
 from ..models.scraping_schema import Article, ArticleContent, Category, Collection
@@ -17,6 +17,40 @@ articles_counter = 0
 counter_lock = asyncio.Lock()
 # Track duplicate URLs.
 seen_url = set()
+# Characters which urljoin strips or normalizes, so hrefs containing them can't take the
+# fast path in resolve_url.
+URLJOIN_NORMALIZED_CHARS = frozenset(" \t\n\r?#;")
+
+
+def resolve_url(href: str, scheme: str, host: str, base_url: str) -> str:
+    """
+    Resolve a link href found on a page against the URL of that page.
+
+    Args:
+        href: The href value of the link.
+        scheme: The scheme of the page URL, parsed once by the caller.
+        host: The host of the page URL, parsed once by the caller.
+        base_url: The URL of the page the link was found on.
+
+    Returns:
+        The absolute URL of the link.
+
+    Notes:
+        - Plain root-relative hrefs (almost all links on the help docs) are resolved
+          without re-parsing the page URL. Everything else falls back to urljoin, including
+          hrefs which urljoin would normalize (whitespace, params, query, fragment, dot
+          segments), so both paths return the same dedup key for the same link.
+    """
+
+    if (
+        href.startswith("/")
+        and not href.startswith("//")
+        and "/." not in href
+        and not any(char in href for char in URLJOIN_NORMALIZED_CHARS)
+    ):
+        return f"{scheme}://{host}{href}"
+
+    return urljoin(base_url, href)
 
 
 async def get_soup(client: httpx.AsyncClient, url: str) -> BeautifulSoup | None:
@@ -97,6 +131,10 @@ async def scrape_article(
         - The function also checks a global article counter to enforce a maximum article limit across the entire scraping session.
     """
 
+    # Parse the article URL once to resolve image sources against it.
+    parsed_url = urlparse(url)
+    scheme, host = parsed_url.scheme, parsed_url.netloc
+
     async with semaphore:
         async with counter_lock:
             global articles_counter
@@ -153,7 +191,7 @@ async def scrape_article(
                     article_contents.append(
                         ArticleContent(
                             type="image",
-                            src=urljoin(url, img.get("src", "")),  # type: ignore
+                            src=resolve_url(img.get("src", ""), scheme, host, url),  # type: ignore
                             alt=img.get("alt", ""),  # type: ignore
                         )
                     )
@@ -164,7 +202,7 @@ async def scrape_article(
                     article_contents.append(
                         ArticleContent(
                             type="image",
-                            src=urljoin(url, node.get("src", "")),  # type: ignore
+                            src=resolve_url(node.get("src", ""), scheme, host, url),  # type: ignore
                             alt=node.get("alt", ""),  # type: ignore
                         )
                     )
@@ -304,6 +342,7 @@ async def scrape_category(
 
     Notes:
         - Article links are resolved relative to the category URL.
+        - Duplicate article links are dropped before the scraping tasks are created.
         - Categories without valid articles are skipped.
         - The articles are scraped concurrently.
     """
@@ -327,8 +366,19 @@ async def scrape_category(
     article_links = category_soup.select("a[href*='/article/']")
     category_articles: List[Article] = []
 
+    parsed_url = urlparse(url)
+    scheme, host = parsed_url.scheme, parsed_url.netloc
+
+    # Skip duplicate links before scheduling so that they don't wait on the semaphore
+    # and delay only to be rejected by get_soup.
+    scheduled_urls = set()
+
     for link in article_links:
-        article_url = urljoin(url, link["href"])  # type: ignore
+        article_url = resolve_url(link["href"], scheme, host, url)  # type: ignore
+        if article_url in scheduled_urls or article_url in seen_url:
+            continue
+        scheduled_urls.add(article_url)
+
         article_name = link.get_text(strip=True)
 
         tasks.append(
@@ -391,8 +441,11 @@ async def scrape_collection(
     category_links = collection_soup.select("a[href*='/category/']")
     categories: List[Category] = []
 
+    parsed_url = urlparse(url)
+    scheme, host = parsed_url.scheme, parsed_url.netloc
+
     for link in category_links:
-        category_url = urljoin(url, link["href"])  # type: ignore
+        category_url = resolve_url(link["href"], scheme, host, url)  # type: ignore
         category_name = link.get_text(strip=True)
 
         category_payload = await scrape_category(
@@ -451,8 +504,11 @@ async def run_scraper(concurrency: int = 2, limit: int = 16) -> List[Collection]
         # Limit concurrent requests to fetch article (default = 2).
         semaphore = asyncio.Semaphore(concurrency)
 
+        parsed_url = urlparse(BASE_URL)
+        scheme, host = parsed_url.scheme, parsed_url.netloc
+
         for link in collection_links:
-            collection_url = urljoin(BASE_URL, link["href"])  # type: ignore
+            collection_url = resolve_url(link["href"], scheme, host, BASE_URL)  # type: ignore
             collection_name = link.get_text(strip=True)
 
             tasks.append(
@@ -1,8 +1,17 @@
 import asyncio
-from typing import List, Literal
+import random
+import re
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from typing import Dict, List, Literal
 from httpx import Headers
-from openai import AsyncOpenAI, APIStatusError
-from groq import AsyncGroq, APIStatusError as GroqAPIStatusError
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError
+from groq import (
+    AsyncGroq,
+    APIConnectionError as GroqAPIConnectionError,
+    APIStatusError as GroqAPIStatusError,
+)
 from groq.types.chat import ChatCompletionMessageParam
 from openai.types.responses import ResponseInputParam
 from ..core.config import env_settings
@@ -24,6 +33,18 @@ ARTICLE_ANALYSIS_MODELS = [
     "meta-llama/llama-4-maverick-17b-128e-instruct",
     "meta-llama/llama-4-scout-17b-16e-instruct",
 ]
+# Max concurrent article analysis requests per model, roughly sized by each model's
+# free tier TPM budget (an article analysis request is ~3k tokens). This lets the
+# models work in parallel without piling concurrent requests on a single model.
+ARTICLE_ANALYSIS_MODEL_CONCURRENCY = {
+    "moonshotai/kimi-k2-instruct": 1,
+    "moonshotai/kimi-k2-instruct-0905": 1,
+    "openai/gpt-oss-20b": 1,
+    "meta-llama/llama-4-maverick-17b-128e-instruct": 1,
+    "meta-llama/llama-4-scout-17b-16e-instruct": 2,
+}
+# Default cap on concurrent article analyses, i.e. every model's request slots in use.
+ARTICLE_ANALYSIS_MAX_CONCURRENCY = sum(ARTICLE_ANALYSIS_MODEL_CONCURRENCY.values())
 # Gap analysis is done once for entire scraped batch, hence a single model will do.
 GAP_ANALYSIS_MODEL = "groq/compound"
 # Groq Compound model can perform browser automation, web search, and visit URLs, hence
@@ -36,6 +57,28 @@ REFINER_MODEL = "openai/gpt-oss-120b"
 # but priority is low so acceptable.
 SAFEGUARD_MODELS = ["openai/gpt-oss-safeguard-20b", "openai/gpt-oss-20b"]
 
+# Bounds (in seconds) for the wait time parsed from a rate-limit response.
+MIN_RETRY_AFTER = 0.1
+MAX_RETRY_AFTER = 65.0
+# Decorrelated-jitter exponential backoff (in seconds) between retries. The wait time
+# parsed from a rate-limit response, if any, serves as its floor.
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+# Client errors which will fail the same way on every retry.
+NON_RETRYABLE_STATUS_CODES = {400, 401, 403}
+# Server errors which usually go away on their own, retried after a backoff.
+TRANSIENT_STATUS_CODES = {500, 502, 503, 504}
+# After this many consecutive transient errors (server or connection errors), an article
+# analysis model is taken out of the rotation for BREAKER_COOLDOWN seconds.
+BREAKER_FAILURE_THRESHOLD = 2
+BREAKER_COOLDOWN = 300.0
+# Groq durations look like "7.52s", "1m30s", "250ms" or "2h1m0.5s".
+DURATION_PATTERN = re.compile(
+    r"(?:([\d.]+)h)?(?:([\d.]+)m(?!s))?(?:([\d.]+)s)?(?:([\d.]+)ms)?"
+)
+# Some rate-limit errors only carry the delay in the message, e.g. "Please try again in 5.289s."
+RETRY_IN_PATTERN = re.compile(r"try again in ((?:[\d.]+(?:ms|h|m|s))+)")
+
 
 class LLMService:
     def __init__(self):
@@ -46,15 +89,51 @@ class LLMService:
             api_key=env_settings.GROQ_API_KEY,
         )
         self.model_idx = 0
-
-    def _get_next_article_analysis_model(self) -> str:
+        # Monotonic time until which each article analysis model is rate limited.
+        self._cooldown: Dict[str, float] = {}
+        # Consecutive transient errors per article analysis model.
+        self._failure_count: Dict[str, int] = defaultdict(int)
+        # Limits concurrent article analysis requests per model.
+        self._model_semaphores: Dict[str, asyncio.Semaphore] = {
+            model: asyncio.Semaphore(ARTICLE_ANALYSIS_MODEL_CONCURRENCY.get(model, 1))
+            for model in ARTICLE_ANALYSIS_MODELS
+        }
+
+    async def _get_next_article_analysis_model(self) -> str:
         """
-        Returns the next model in the rotation for article analysis.
+        Returns the next model in the rotation for article analysis, skipping models
+        which are still cooling down from a rate limit. Models with a free request slot
+        are preferred over busy ones. If all models are cooling down, waits until the
+        first one is available again.
         """
 
-        model = ARTICLE_ANALYSIS_MODELS[self.model_idx]
-        self.model_idx = (self.model_idx + 1) % len(ARTICLE_ANALYSIS_MODELS)
-        return model
+        total_models = len(ARTICLE_ANALYSIS_MODELS)
+
+        while True:
+            now = time.monotonic()
+            available_idx: int | None = None
+
+            for offset in range(total_models):
+                idx = (self.model_idx + offset) % total_models
+                model = ARTICLE_ANALYSIS_MODELS[idx]
+
+                if self._cooldown.get(model, 0.0) > now:
+                    continue
+                if available_idx is None:
+                    available_idx = idx
+                if not self._model_semaphores[model].locked():
+                    available_idx = idx
+                    break
+
+            if available_idx is not None:
+                self.model_idx = (available_idx + 1) % total_models
+                return ARTICLE_ANALYSIS_MODELS[available_idx]
+
+            wait_time = min(self._cooldown.values()) - now
+            print(
+                f"All article analysis models rate limited. Sleeping {wait_time:.2f}s..."
+            )
+            await asyncio.sleep(wait_time)
 
     def _get_temperature(
         self,
@@ -84,20 +163,96 @@ class LLMService:
         else:
             return 0.1
 
-    def _parse_retry_after(self, headers: Headers) -> float:
+    def _parse_duration(self, value: str) -> float | None:
         """
-        Extracts wait time from headers or error message.
+        Parses a Groq duration string (e.g. "7.52s", "1m30s", "250ms") into seconds.
+        Returns None if the value is not a valid duration.
         """
 
-        # Wait for time equal to value specified in retry-after header returned by Groq.
-        if headers and "retry-after" in headers:
-            try:
-                return float(headers["retry-after"])
-            except Exception:
-                pass
+        match = DURATION_PATTERN.fullmatch(value.strip())
+        if not match or not any(match.groups()):
+            return None
+
+        try:
+            hours, minutes, seconds, millis = (
+                float(group) if group else 0.0 for group in match.groups()
+            )
+        except ValueError:
+            return None
+
+        return hours * 3600 + minutes * 60 + seconds + millis / 1000
 
-        # Default backoff if retry-after header in present.
-        return 60.0
+    def _parse_retry_after(self, headers: Headers, message: str = "") -> float | None:
+        """
+        Extracts wait time from headers or error message. Returns None if no hint is present.
+
+        The sources are checked in order of precision:
+            - retry-after-ms header (milliseconds)
+            - retry-after header (seconds)
+            - x-ratelimit-reset-tokens / x-ratelimit-reset-requests headers (durations)
+            - "try again in ..." hint in the error message
+        The result is clamped to [MIN_RETRY_AFTER, MAX_RETRY_AFTER].
+        """
+
+        wait_time: float | None = None
+
+        if headers:
+            if "retry-after-ms" in headers:
+                try:
+                    wait_time = float(headers["retry-after-ms"]) / 1000
+                except ValueError:
+                    pass
+
+            # Wait for time equal to value specified in retry-after header returned by Groq.
+            if wait_time is None and "retry-after" in headers:
+                try:
+                    wait_time = float(headers["retry-after"])
+                except ValueError:
+                    pass
+
+            for header in ("x-ratelimit-reset-tokens", "x-ratelimit-reset-requests"):
+                if wait_time is None and header in headers:
+                    wait_time = self._parse_duration(headers[header])
+
+        # Groq sometimes only embeds the delay in the error message.
+        if wait_time is None and message:
+            match = RETRY_IN_PATTERN.search(message)
+            if match:
+                wait_time = self._parse_duration(match.group(1))
+
+        if wait_time is None:
+            return None
+
+        return min(max(wait_time, MIN_RETRY_AFTER), MAX_RETRY_AFTER)
+
+    def _get_backoff(self, previous: float, retry_after: float | None) -> float:
+        """
+        Returns the wait time before the next retry using decorrelated-jitter exponential
+        backoff, i.e. min(cap, uniform(base, previous * 3)). The wait time parsed from the
+        rate-limit response, if any, is used as the floor.
+        """
+
+        backoff = min(BACKOFF_CAP, random.uniform(BACKOFF_BASE, previous * 3))
+        if retry_after is not None:
+            backoff = max(backoff, retry_after)
+
+        return backoff
+
+    def _record_failure(self, model: str) -> None:
+        """
+        Counts a transient failure (server or connection error) of an article analysis
+        model. Once the model keeps failing, its breaker is opened so that the rotation
+        routes the following requests to healthy models. Errors caused by the request
+        itself (e.g. a 400) are not counted, as they say nothing about the model.
+        """
+
+        self._failure_count[model] += 1
+        if self._failure_count[model] >= BREAKER_FAILURE_THRESHOLD:
+            self._cooldown[model] = time.monotonic() + BREAKER_COOLDOWN
+            print(
+                f"{model} failed {self._failure_count[model]} times in a row. "
+                f"Pausing it for {BREAKER_COOLDOWN:.0f}s..."
+            )
 
     async def get_llm_response(
         self,
@@ -131,6 +286,7 @@ class LLMService:
         """
 
         retries = 5
+        wait_time = BACKOFF_BASE
 
         for attempt in range(retries):
             # Set model and response_format based on mode
@@ -139,7 +295,7 @@ class LLMService:
                 response_format = GapAnalysisOutputList
 
             elif mode == "article_analysis":
-                model = self._get_next_article_analysis_model()
+                model = await self._get_next_article_analysis_model()
                 response_format = ArticleAnalysisOutput
 
             elif mode == "refine_competitor_analysis":
@@ -153,18 +309,28 @@ class LLMService:
             try:
                 print(f"🤖 Req: {model} | Attempt {attempt + 1}")
 
-                response = await self.client.responses.parse(
-                    model=model,
-                    instructions=system_prompt,
-                    input=input,
-                    text_format=response_format,
-                    temperature=self._get_temperature(mode),
+                # Article analysis requests hold a slot of their model while in flight.
+                model_semaphore = (
+                    self._model_semaphores[model]
+                    if mode == "article_analysis"
+                    else nullcontext()
                 )
+                async with model_semaphore:
+                    response = await self.client.responses.parse(
+                        model=model,
+                        instructions=system_prompt,
+                        input=input,
+                        text_format=response_format,
+                        temperature=self._get_temperature(mode),
+                    )
 
                 content = response.output_parsed
                 if not content:
                     raise ValueError("Empty response")
 
+                if mode == "article_analysis":
+                    self._failure_count[model] = 0
+
                 return content
 
             except APIStatusError as e:
@@ -177,16 +343,53 @@ class LLMService:
                     if e.message.find("TPM") == -1 and e.message.find("RPM") == -1:
                         return None
 
-                    wait_time = self._parse_retry_after(e.response.headers)
-                    wait_time += 1.0
+                    wait_time = self._get_backoff(
+                        wait_time,
+                        self._parse_retry_after(e.response.headers, e.message),
+                    )
+
+                    # For article analysis, put the model on cooldown and retry right away
+                    # with the next available model in the rotation.
+                    if mode == "article_analysis":
+                        self._cooldown[model] = time.monotonic() + wait_time
+                        print(
+                            f"Rate Limit ({model}). Cooling down for {wait_time:.2f}s..."
+                        )
+                        continue
 
                     print(f"Rate Limit ({model}). Sleeping {wait_time:.2f}s...")
                     await asyncio.sleep(wait_time)
                     continue
 
+                # Fail fast on errors which retrying cannot fix.
+                if e.status_code in NON_RETRYABLE_STATUS_CODES:
+                    print(f"Non-retryable API Error ({model}): {e}")
+                    return None
+
+                # Back off before retrying transient server errors.
+                if e.status_code in TRANSIENT_STATUS_CODES:
+                    if mode == "article_analysis":
+                        self._record_failure(model)
+                    wait_time = self._get_backoff(wait_time, None)
+                    print(
+                        f"Server Error ({model}): {e}. Retrying in {wait_time:.2f}s..."
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+
                 # Log other API errors and continue.
                 print(f"API Error ({model}): {e}")
 
+            except APIConnectionError as e:
+                # Covers connection failures and timeouts, back off before retrying.
+                if mode == "article_analysis":
+                    self._record_failure(model)
+                wait_time = self._get_backoff(wait_time, None)
+                print(
+                    f"Connection Error ({model}): {e}. Retrying in {wait_time:.2f}s..."
+                )
+                await asyncio.sleep(wait_time)
+
             except Exception as e:
                 print(f"Exception occurred: {e}")
 
@@ -208,6 +411,7 @@ class LLMService:
             Returns unstructured, text output.
         """
         retries = 5
+        wait_time = BACKOFF_BASE
         model = (
             COMPETITOR_ANALYSIS_RESEARCH_MODEL
             if mode == "competitor_analysis"
@@ -249,16 +453,40 @@ class LLMService:
                     if e.message.find("TPM") == -1 and e.message.find("RPM") == -1:
                         return ""
 
-                    wait_time = self._parse_retry_after(e.response.headers)
-                    wait_time += 1.0
+                    wait_time = self._get_backoff(
+                        wait_time,
+                        self._parse_retry_after(e.response.headers, e.message),
+                    )
 
                     print(f"Rate Limit ({model}). Sleeping {wait_time:.2f}s...")
                     await asyncio.sleep(wait_time)
                     continue
 
+                # Fail fast on errors which retrying cannot fix.
+                if e.status_code in NON_RETRYABLE_STATUS_CODES:
+                    print(f"Non-retryable API Error ({model}): {e}")
+                    return ""
+
+                # Back off before retrying transient server errors.
+                if e.status_code in TRANSIENT_STATUS_CODES:
+                    wait_time = self._get_backoff(wait_time, None)
+                    print(
+                        f"Server Error ({model}): {e}. Retrying in {wait_time:.2f}s..."
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+
                 # Log other API errors and continue.
                 print(f"API Error ({model}): {e}")
 
+            except GroqAPIConnectionError as e:
+                # Covers connection failures and timeouts, back off before retrying.
+                wait_time = self._get_backoff(wait_time, None)
+                print(
+                    f"Connection Error ({model}): {e}. Retrying in {wait_time:.2f}s..."
+                )
+                await asyncio.sleep(wait_time)
+
             except Exception as e:
                 print(f"Exception occurred: {e}")
 
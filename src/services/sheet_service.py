@@ -1,33 +1,61 @@
 import json
+import threading
 import gspread
+from itertools import islice
+from functools import lru_cache
 from typing import Dict, List, Literal
-from gspread.utils import ValueInputOption
+from gspread.utils import ValueInputOption, absolute_range_name, rowcol_to_a1
 from ..core.config import env_settings
-from gspread_formatting import (
+from gspread_formatting import CellFormat, TextFormat
+from gspread_formatting.batch_update_requests import (
     set_frozen,
-    set_column_width,
+    set_column_widths,
     set_row_height,
     format_cell_range,
-    CellFormat,
-    TextFormat,
 )
 
-HEADER_FORMAT = CellFormat(
-    backgroundColor={"red": 0.93, "green": 0.94, "blue": 0.96},
-    textFormat=TextFormat(bold=True, fontSize=13),
-    horizontalAlignment="CENTER",
-    wrapStrategy="WRAP",
-)
 
-TITLE_FORMAT = CellFormat(
-    textFormat=TextFormat(bold=True, fontSize=16),
-    horizontalAlignment="CENTER",
-    wrapStrategy="WRAP",
-)
+@lru_cache(maxsize=1)
+def _get_header_format() -> CellFormat:
+    """
+    Returns the cell format of the table header row, built once.
+    """
 
-BODY_FORMAT = CellFormat(
-    verticalAlignment="MIDDLE", wrapStrategy="WRAP"
-)
+    return CellFormat(
+        backgroundColor={"red": 0.93, "green": 0.94, "blue": 0.96},
+        textFormat=TextFormat(bold=True, fontSize=13),
+        horizontalAlignment="CENTER",
+        wrapStrategy="WRAP",
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_title_format() -> CellFormat:
+    """
+    Returns the cell format of the sheet title row, built once.
+    """
+
+    return CellFormat(
+        textFormat=TextFormat(bold=True, fontSize=16),
+        horizontalAlignment="CENTER",
+        wrapStrategy="WRAP",
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_body_format() -> CellFormat:
+    """
+    Returns the cell format of the table body rows, built once.
+    """
+
+    return CellFormat(verticalAlignment="MIDDLE", wrapStrategy="WRAP")
+
+
+# Number of body rows sent per value range when writing a table.
+SHEET_WRITE_CHUNK_ROWS = 100
+# Messages of the 400 errors returned when a cached worksheet handle points to a tab
+# which was deleted ("Unable to parse range") or recreated ("No grid with id").
+STALE_WORKSHEET_ERRORS = ("No grid with id", "Unable to parse range")
 
 COLUMN_WIDTHS_ARTICLES_CATALOGUE = {
     "A": 132,
@@ -84,9 +112,77 @@ COLUMN_WIDTHS_INSIGHTS = {
     "G": 150,
 }
 
+# Worksheet handles looked up (or created) during this process, keyed by sheet name.
+_worksheet_cache: Dict[str, gspread.Worksheet] = {}
+# Sheet updates run in FastAPI's threadpool, possibly for concurrent pipeline runs. This
+# lock guards the creation and reset of the cached client, spreadsheet and worksheet
+# handles, so that a re-authorization can't clear them halfway through another lookup.
+_sheet_handles_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_credentials() -> Dict:
+    """
+    Returns the service account credentials parsed from the environment. The JSON
+    does not change while the process runs, so it is decoded only once, even when
+    the client has to be authorized again.
+    """
+
+    return json.loads(env_settings.GOOGLE_CREDS_JSON)
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> gspread.Client:
+    """
+    Returns the authorized gspread client. Authorizing involves an OAuth token exchange,
+    so the client is created once and reused across sheet updates.
+    """
+
+    return gspread.service_account_from_dict(_get_credentials())
+
+
+@lru_cache(maxsize=1)
+def _get_spreadsheet() -> gspread.Spreadsheet:
+    """
+    Returns the spreadsheet handle, opened once and reused across sheet updates.
+    Must be called with _sheet_handles_lock held.
+    """
+
+    return _get_client().open_by_key(env_settings.SHEET_ID)
+
+
+def _get_worksheet(sheet_name: str) -> gspread.Worksheet:
+    """
+    Returns the worksheet with the given name, creating it if it does not exist.
+    Must be called with _sheet_handles_lock held.
+    """
+
+    worksheet = _worksheet_cache.get(sheet_name)
+    if worksheet is None:
+        sheet = _get_spreadsheet()
+        try:
+            worksheet = sheet.worksheet(sheet_name)
+        except gspread.exceptions.WorksheetNotFound:
+            worksheet = sheet.add_worksheet(title=sheet_name, rows=1000, cols=20)
+        _worksheet_cache[sheet_name] = worksheet
+
+    return worksheet
+
+
+def _reset_sheet_handles() -> None:
+    """
+    Drops the cached client, spreadsheet and worksheet handles so that the next
+    update authorizes and looks the worksheets up again.
+    """
+
+    with _sheet_handles_lock:
+        _get_client.cache_clear()
+        _get_spreadsheet.cache_clear()
+        _worksheet_cache.clear()
+
 
 def update_google_sheets(
-    flattened_data: List[Dict],
+    flattened_data: Dict[str, List],
     sheet_name: Literal[
         "Articles Catalogue",
         "Gap Analysis",
@@ -99,80 +195,213 @@ def update_google_sheets(
     This function updates the respective Google Sheets with the provided data.
 
     Args:
-        flattened_data: List of dicts representing the data to be updated in Google Sheets.
+        flattened_data: Dict mapping each column header to the list of its values, representing the data to be updated in Google Sheets.
         sheet_name: Name of the sheet/tab in Google Sheets where the data needs to be updated.
 
     Notes:
         - This function is only for updating the "Articles Catalogue" and "Gap Analysis" sheets as they have single table.
     """
 
-    if len(flattened_data) == 0:
+    if get_row_count(flattened_data) == 0:
         print(f"No data available for {sheet_name}, nothing updated")
         return
 
     try:
-        # Auth
-        auth_dict = json.loads(env_settings.GOOGLE_CREDS_JSON)
-        gc = gspread.service_account_from_dict(auth_dict)
-        sheet = gc.open_by_key(env_settings.SHEET_ID)
+        write_with_reauth({sheet_name: flattened_data})
+        print(f"{sheet_name} sheet updated successfully.")
+    except Exception as e:
+        print(f"Error {sheet_name} sheet: {e}")
+        raise e
 
-        # Get or create the worksheet.
-        try:
-            worksheet = sheet.worksheet(sheet_name)
-        except Exception:
-            worksheet = sheet.add_worksheet(title=sheet_name, rows=1000, cols=20)
 
+def update_google_sheets_batch(tables: Dict[str, Dict[str, List]]) -> None:
+    """
+    This function updates several Google Sheets at once with the provided data.
+
+    Args:
+        tables: Dict mapping the name of each sheet/tab to the flattened data to be written on it.
+
+    Notes:
+        - The styling of all the sheets is sent in one batch update and their values in
+          another, so writing the 2 competitor analysis sheets costs the same number of
+          requests as writing one.
+    """
+
+    non_empty_tables: Dict[str, Dict[str, List]] = {}
+    for sheet_name, flattened_data in tables.items():
+        if get_row_count(flattened_data) == 0:
+            print(f"No data available for {sheet_name}, nothing updated")
+        else:
+            non_empty_tables[sheet_name] = flattened_data
+
+    if len(non_empty_tables) == 0:
+        return
+
+    sheet_names = ", ".join(non_empty_tables)
+    try:
+        write_with_reauth(non_empty_tables)
+        print(f"{sheet_names} sheets updated successfully.")
+    except Exception as e:
+        print(f"Error {sheet_names} sheets: {e}")
+        raise e
+
+
+def write_with_reauth(tables: Dict[str, Dict[str, List]]) -> None:
+    """
+    This function writes the provided tables, retrying once with fresh handles
+    if the cached credentials are rejected or a cached worksheet no longer exists.
+    """
+
+    try:
+        write_worksheets(tables)
+    except gspread.exceptions.APIError as e:
+        if e.code == 401:
+            # The cached credentials were rejected, authorize again and retry once.
+            print(
+                f"Sheets auth expired while updating {', '.join(tables)}, re-authorizing..."
+            )
+        elif e.code == 400 and any(
+            message in e.error.get("message", "") for message in STALE_WORKSHEET_ERRORS
+        ):
+            # A tab was deleted or recreated in the Sheets UI since it was cached, look
+            # it up (or create it) again and retry once.
+            print(
+                f"Cached worksheets of {', '.join(tables)} are stale, looking them up again..."
+            )
+        else:
+            raise e
+
+        _reset_sheet_handles()
+        write_worksheets(tables)
+
+
+def write_worksheets(tables: Dict[str, Dict[str, List]]) -> None:
+    """
+    This function clears each worksheet, then writes and styles the provided data on it.
+
+    Args:
+        tables: Dict mapping the name of each sheet/tab to the flattened data to be written on it.
+            The flattened data must have at least one row.
+    """
+
+    # Look up every handle at once, under the lock. A concurrent reset then only
+    # affects the next lookup, while this write keeps using the handles it holds.
+    with _sheet_handles_lock:
+        sheet = _get_spreadsheet()
+        worksheets = {sheet_name: _get_worksheet(sheet_name) for sheet_name in tables}
+
+    format_requests: List[Dict] = []
+    value_ranges: List[Dict] = []
+
+    for sheet_name, flattened_data in tables.items():
+        worksheet = worksheets[sheet_name]
         worksheet.clear()
 
-        rows: List[List[str]] = []
+        format_requests.extend(build_format_requests(worksheet, sheet_name))
 
-        # Sheet Title
-        rows.append([sheet_name])
-        format_cell_range(worksheet, "A1:Z1", TITLE_FORMAT)
-        set_row_height(worksheet, "1", 50)
+        # Ranges of a spreadsheet wide batch update must name their sheet.
+        for value_range in build_value_ranges(flattened_data, sheet_name):
+            value_range["range"] = absolute_range_name(sheet_name, value_range["range"])
+            value_ranges.append(value_range)
 
-        # Table
-        headers = list(flattened_data[0].keys())
-        rows.append(headers)
+    # All the styling (title, header, body, frozen rows and col widths) is sent in a
+    # single batch update instead of one API call per rule, which easily tripped
+    # the Sheets write quota. Likewise, every chunk of values goes out together.
+    sheet.batch_update({"requests": format_requests})
+    sheet.values_batch_update(
+        {"valueInputOption": ValueInputOption.user_entered, "data": value_ranges}
+    )
 
-        for row in flattened_data:
-            rows.append(list(row.values()))
 
-        # Style header
-        format_cell_range(worksheet, "A2:Z2", HEADER_FORMAT)
-        set_row_height(worksheet, "2", 45)
-        set_frozen(worksheet, rows=2)
+def build_format_requests(worksheet: gspread.Worksheet, sheet_name: str) -> List[Dict]:
+    """
+    This function accepts a worksheet instance along with its name
+    and returns the batch update requests which style it.
+    """
 
+    # Set col width.
+    if sheet_name == "Articles Catalogue":
+        col_widths = COLUMN_WIDTHS_ARTICLES_CATALOGUE
+    elif sheet_name == "Gap Analysis":
+        col_widths = COLUMN_WIDTHS_GAP_ANALYSIS
+    elif sheet_name == "Competitor Comparison":
+        col_widths = COLUMN_WIDTHS_COMP_COMPARISON
+    elif sheet_name == "Strategic Insights & Recommendations":
+        col_widths = COLUMN_WIDTHS_INSIGHTS
+    else:
+        col_widths = COLUMN_WIDTHS_ARTICLES_CATALOGUE
+
+    return [
+        # Style title
+        *format_cell_range(worksheet, "A1:Z1", _get_title_format()),
+        *set_row_height(worksheet, "1", 50),
+        # Style header
+        *format_cell_range(worksheet, "A2:Z2", _get_header_format()),
+        *set_row_height(worksheet, "2", 45),
+        *set_frozen(worksheet, rows=2),
         # Style body
-        format_cell_range(worksheet, "A3: Z1000", BODY_FORMAT)
-        set_row_height(worksheet, "3:1000", 140)
-
-        # Set col width.
-        if sheet_name == "Articles Catalogue":
-            update_worksheet_cols(worksheet, COLUMN_WIDTHS_ARTICLES_CATALOGUE)
-        elif sheet_name == "Gap Analysis":
-            update_worksheet_cols(worksheet, COLUMN_WIDTHS_GAP_ANALYSIS)
-        elif sheet_name == "Competitor Comparison":
-            update_worksheet_cols(worksheet, COLUMN_WIDTHS_COMP_COMPARISON)
-        elif sheet_name == "Strategic Insights & Recommendations":
-            update_worksheet_cols(worksheet, COLUMN_WIDTHS_INSIGHTS)
-        else:
-            update_worksheet_cols(worksheet, COLUMN_WIDTHS_ARTICLES_CATALOGUE)
+        *format_cell_range(worksheet, "A3:Z1000", _get_body_format()),
+        *set_row_height(worksheet, "3:1000", 140),
+        *build_dimension_requests(worksheet, col_widths),
+    ]
+
+
+def get_row_count(flattened_data: Dict[str, List]) -> int:
+    """
+    This function returns the number of rows of the column-wise flattened data.
+    """
+
+    return len(next(iter(flattened_data.values()), []))
 
-        worksheet.update(rows, value_input_option=ValueInputOption.user_entered)
-        print(f"{sheet_name} sheet updated successfully.")
-    except Exception as e:
-        print(f"Error {sheet_name} sheet: {e}")
-        raise e
 
+def build_value_ranges(flattened_data: Dict[str, List], title: str) -> List[Dict]:
+    """
+    This function accepts the flattened data of a table along with its title
+    and returns the value ranges which write them on the sheet.
+
+    Args:
+        flattened_data: Dict mapping each column header to the list of its values, must have at least one row.
+        title: Title written in the first row, above the table headers.
+
+    Returns:
+        List of value ranges in the form of `{"range": "...", "values": [[...]]}`.
+
+    Notes:
+        - The body rows are split into chunks of SHEET_WRITE_CHUNK_ROWS rows, each with
+          its own range, instead of one list spanning the whole table.
+    """
 
-def update_worksheet_cols(
+    headers = list(flattened_data)
+    last_col = rowcol_to_a1(1, len(headers)).rstrip("0123456789")
+
+    value_ranges: List[Dict] = [
+        # Sheet Title and table headers
+        {"range": f"A1:{last_col}2", "values": [[title], headers]},
+    ]
+
+    # Transpose the columns into rows lazily, so that rows are only materialized one
+    # chunk at a time. The row tuples are sent as they are, since they serialize to
+    # the same JSON arrays as lists.
+    rows = zip(*flattened_data.values())
+
+    # Body starts on the 3rd row, right below the headers.
+    start_row = 3
+    while values := list(islice(rows, SHEET_WRITE_CHUNK_ROWS)):
+        end_row = start_row + len(values) - 1
+        value_ranges.append(
+            {"range": f"A{start_row}:{last_col}{end_row}", "values": values}
+        )
+        start_row = end_row + 1
+
+    return value_ranges
+
+
+def build_dimension_requests(
     worksheet: gspread.Worksheet, col_widths: Dict[str, int]
-) -> None:
+) -> List[Dict]:
     """
-    This function applies accepts a worksheet instance and column widths rules
-    and applies them on the sheet.
+    This function accepts a worksheet instance and column widths rules
+    and returns the batch update requests which apply them on the sheet.
     """
 
-    for col, width in col_widths.items():
-        set_column_width(worksheet, col, width)
+    return set_column_widths(worksheet, list(col_widths.items()))
@@ -1,4 +1,17 @@
-from typing import Dict, List, Literal
+from collections import Counter
+from itertools import compress
+from operator import attrgetter, mul
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Set,
+    Tuple,
+)
 from ..core.config import env_settings
 from ..models.analysis_schema import (
     ArticleAnalysisInput,
@@ -13,7 +26,45 @@ from ..models.analysis_schema import (
     QualityMetrics,
     StructuralObservations,
 )
-from ..models.scraping_schema import Article, Collection
+from ..models.scraping_schema import Article, ArticleContent, Category, Collection
+
+# Maximum characters of article markdown sent for analysis.
+_MARKDOWN_CHAR_BUDGET = 11000
+
+# Keys of the audience, content type and quality score counters, in the order the
+# gap analysis metrics list them.
+_AUD_KEYS = ("beginner", "intermediate", "advanced", "mixed")
+_CT_KEYS = ("how-to", "conceptual", "faq", "reference", "troubleshooting", "mixed")
+_Q_KEYS = (1, 2, 3, 4, 5)
+# Audiences whose articles count as beginner/advanced content.
+_BEGINNER_AUDIENCES = frozenset(("beginner", "mixed"))
+_ADVANCED_AUDIENCES = frozenset(("advanced", "mixed"))
+# Article fields read by the gap analysis counters, and their getter.
+_GAP_METRIC_FIELD_NAMES = (
+    "collection",
+    "category",
+    "target_audience",
+    "content_type",
+    "quality_score",
+    "identified_gaps",
+    "has_screenshots",
+    "has_videos",
+    "has_tables",
+)
+_GAP_METRIC_FIELDS = attrgetter(*_GAP_METRIC_FIELD_NAMES)
+
+
+def _iter_categories(
+    collections: List[Collection],
+) -> Iterator[Tuple[Collection, Category]]:
+    """
+    Yields each category of the scraped data along with its collection, flattening the
+    collection > category hierarchy shared by the normalizers.
+    """
+
+    for collection in collections:
+        for category in collection.categories:
+            yield collection, category
 
 
 def normalize_scraped_articles(
@@ -32,25 +83,25 @@ def normalize_scraped_articles(
         A list of LLM-ready articles with relevant metadata and trimmed context
         to save tokens.
     """
-    normalized_articles: List[ArticleAnalysisInput] = []
-    for collection in collections:
-        for category in collection.categories:
-            for article in category.articles:
-                normalized_articles.append(
-                    ArticleAnalysisInput(
-                        article_id=article.article_id,
-                        article_title=article.article_title,
-                        category=category.category_title,
-                        collection=collection.collection_title,
-                        url=article.url,
-                        has_screenshots=article.has_screenshots,
-                        has_videos=article.has_videos,
-                        has_tables=article.has_tables,
-                        last_updated=article.last_updated,
-                        word_count=article.word_count,
-                        content=normalize_article_content_to_markdown(article),
-                    )
-                )
+    # The scraped articles are already validated models, hence we skip
+    # re-validating the normalized copies.
+    normalized_articles: List[ArticleAnalysisInput] = [
+        ArticleAnalysisInput.model_construct(
+            article_id=article.article_id,
+            article_title=article.article_title,
+            category=category.category_title,
+            collection=collection.collection_title,
+            url=article.url,
+            has_screenshots=article.has_screenshots,
+            has_videos=article.has_videos,
+            has_tables=article.has_tables,
+            last_updated=article.last_updated,
+            word_count=article.word_count,
+            content=normalize_article_content_to_markdown(article),
+        )
+        for collection, category in _iter_categories(collections)
+        for article in category.articles
+    ]
 
     return normalized_articles
 
@@ -70,105 +121,169 @@ def normalize_article_content_to_markdown(article: Article) -> str:
     """
 
     md_lines: List[str] = []
-
-    md_lines.append(f"Title: {article.article_title}")
-    md_lines.append(f"URL: {article.url}")
-    md_lines.append("---- Content ----")
+    append = md_lines.append
+
+    # Characters still allowed in the markdown. Every line is charged its length plus
+    # the newline joining it, the first line has none, hence the extra one.
+    remaining = _emit_md_lines(
+        (
+            f"Title: {article.article_title}",
+            f"URL: {article.url}",
+            "---- Content ----",
+        ),
+        append,
+        _MARKDOWN_CHAR_BUDGET + 1,
+    )
 
     for block in article.content:
-        text = block.text if block.text else ""
-
-        # Handle headings.
-        if block.type == "heading":
-            prefix = "#" * (block.level or 1)
-            md_lines.append(f"{prefix} {text}")
-
-        # Handle paragraphs.
-        elif block.type == "paragraph":
-            md_lines.append(text)
-
-        # Handle lists.
-        elif block.type == "list":
-            if block.items:
-                # Use number for ordered lists.
-                li_marker = "1." if block.ordered else "-"
-                for item in block.items:
-                    md_lines.append(f"{li_marker} {item}")
-
-        # Handle images (just alt text).
-        elif block.type == "image":
-            md_lines.append(f"Image: {block.alt or 'Image'}")
-
-        # Handle videos (just platform).
-        elif block.type == "video":
-            md_lines.append(f"Video: {block.platform}")
-
-        # Handle callouts.
-        elif block.type == "callout":
-            # Variant provides context about whether callout is info or warn.
-            md_lines.append(f"Callout ({block.variant}): ")
-            md_lines.append(f"> {text}")
-
-        # Handle tables.
-        elif block.type == "table":
-            if block.headers:
-                md_lines.append(f"| {'|'.join(block.headers)} |")
-            if block.rows:
-                for row in block.rows:
-                    md_lines.append(f"| {'|'.join(row)} |")
-
-    markdown_content = "\n".join(md_lines)
-    return markdown_content[:11000]
+        # Once the budget is used up the remaining blocks would be dropped anyway,
+        # so we stop converting them.
+        if remaining <= 0:
+            break
+
+        handler = _BLOCK_HANDLERS.get(block.type)
+        if handler is not None:
+            remaining = _emit_md_lines(handler(block), append, remaining)
+
+    return "\n".join(md_lines)
+
+
+def _emit_md_lines(
+    lines: Iterable[str], append: Callable[[str], None], remaining: int
+) -> int:
+    """
+    Appends the lines while charging them against the remaining character budget. The
+    line which exceeds the budget is cut and the lines after it are never pulled from
+    the iterable. Returns the budget left, which is 0 once anything had to be cut.
+    """
+
+    for line in lines:
+        line_len = len(line) + 1
+        if line_len > remaining:
+            if remaining > 0:
+                append(line[: remaining - 1])
+            return 0
+
+        append(line)
+        remaining -= line_len
+
+    return remaining
+
+
+def _heading_lines(block: ArticleContent) -> Iterable[str]:
+    prefix = "#" * (block.level or 1)
+    return (f"{prefix} {block.text or ''}",)
+
+
+def _paragraph_lines(block: ArticleContent) -> Iterable[str]:
+    return (block.text or "",)
+
+
+def _list_lines(block: ArticleContent) -> Iterable[str]:
+    if not block.items:
+        return ()
+
+    # Use number for ordered lists.
+    li_marker = "1. " if block.ordered else "- "
+    return (li_marker + item for item in block.items)
+
+
+def _image_lines(block: ArticleContent) -> Iterable[str]:
+    # Just alt text.
+    return (f"Image: {block.alt or 'Image'}",)
+
+
+def _video_lines(block: ArticleContent) -> Iterable[str]:
+    # Just platform.
+    return (f"Video: {block.platform}",)
+
+
+def _callout_lines(block: ArticleContent) -> Iterable[str]:
+    # Variant provides context about whether callout is info or warn.
+    return (f"Callout ({block.variant}): ", f"> {block.text or ''}")
+
+
+def _table_lines(block: ArticleContent) -> Iterator[str]:
+    if block.headers:
+        yield "| " + "|".join(block.headers) + " |"
+    if block.rows:
+        # Rows are formatted lazily, so a long table stops at the budget.
+        for row in block.rows:
+            yield "| " + "|".join(row) + " |"
+
+
+# Markdown converters for each article content block type. Each converter returns
+# the markdown lines of the block.
+_BLOCK_HANDLERS: Dict[str, Callable[[ArticleContent], Iterable[str]]] = {
+    "heading": _heading_lines,
+    "paragraph": _paragraph_lines,
+    "list": _list_lines,
+    "image": _image_lines,
+    "video": _video_lines,
+    "callout": _callout_lines,
+    "table": _table_lines,
+}
 
 
 def normalize_analyzed_articles_to_catalogue(
-    analyzed_articles: List[ArticleAnalysisResult], articles: List[ArticleAnalysisInput]
+    analysis_map: Mapping[str, ArticleAnalysisOutput],
+    articles: List[ArticleAnalysisInput],
 ) -> List[ArticlesCatalogue]:
     """
     This function combines the original article metadata with the analysis output
     from LLM to create a catalogue of articles with insights for spreadsheet display.
 
     Args:
-        - analyzed_articles: The list of analyzed articles returned by LLM after analysis.
+        - analysis_map: The analysis output of each analyzed article keyed by article_id
+          (see build_analysis_map).
         - articles: The original list of LLM-ready articles used for analysis.
 
     Returns:
         A list of articles with combined metadata, analysis and gaps for spreadsheet display.
     """
 
-    analysis_map: Dict[str, ArticleAnalysisOutput] = {
-        result.article_id: result.analysis for result in analyzed_articles
-    }
+    # Both the article and its analysis are already validated models, hence
+    # we skip re-validating the combined copy. Articles without analysis are skipped.
+    catalogue: List[ArticlesCatalogue] = [
+        ArticlesCatalogue.model_construct(
+            article_id=article.article_id,
+            article_title=article.article_title,
+            category=article.category,
+            collection=article.collection,
+            has_screenshots=article.has_screenshots,
+            has_videos=article.has_videos,
+            has_tables=article.has_tables,
+            last_updated=article.last_updated,
+            url=article.url,
+            word_count=article.word_count,
+            content_type=analysis.content_type,
+            topics_covered=analysis.topics_covered,
+            quality_score=analysis.quality_score,
+            target_audience=analysis.target_audience,
+            identified_gaps=analysis.identified_gaps,
+        )
+        for article in articles
+        if (analysis := analysis_map.get(article.article_id)) is not None
+    ]
 
-    catalogue: List[ArticlesCatalogue] = []
+    return catalogue
 
-    for article in articles:
-        analysis = analysis_map.get(article.article_id)
 
-        if not analysis:
-            continue
+def build_analysis_map(
+    analyzed_articles: List[ArticleAnalysisResult],
+) -> Dict[str, ArticleAnalysisOutput]:
+    """
+    This function maps each article_id to its analysis output. The map is built once
+    by the caller and can be shared by every consumer of the analysis results.
 
-        catalogue.append(
-            ArticlesCatalogue(
-                article_id=article.article_id,
-                article_title=article.article_title,
-                category=article.category,
-                collection=article.collection,
-                has_screenshots=article.has_screenshots,
-                has_videos=article.has_videos,
-                has_tables=article.has_tables,
-                last_updated=article.last_updated,
-                url=article.url,
-                word_count=article.word_count,
-                content_type=analysis.content_type,
-                topics_covered=analysis.topics_covered,
-                quality_score=analysis.quality_score,
-                target_audience=analysis.target_audience,
-                identified_gaps=analysis.identified_gaps,
-            )
-        )
+    Args:
+        - analyzed_articles: The list of analyzed articles returned by LLM after analysis.
 
-    return catalogue
+    Returns:
+        A dict of analysis outputs keyed by article_id.
+    """
+
+    return {result.article_id: result.analysis for result in analyzed_articles}
 
 
 def generate_gap_analysis_input(
@@ -186,15 +301,19 @@ def generate_gap_analysis_input(
         GapAnalysisInput: A list of metrics generated from articles metadata in structured format for evaluation.
     """
 
+    # Gather the counters of all the metrics in a single pass over the data.
+    counts = accumulate_gap_metrics(scraped_data, articles)
+
     # Compute metrics.
-    corpus_summary = compute_corpus_summary(scraped_data, articles)
-    audience_metrics = compute_audience_metrics(scraped_data, articles)
-    content_type_metrics = compute_content_type_metrics(scraped_data, articles)
-    quality_metrics = compute_quality_metrics(scraped_data, articles)
-    gap_signals = compute_gap_signals(scraped_data, articles)
-    structural_observations = compute_structural_observations(scraped_data, articles)
-
-    return GapAnalysisInput(
+    corpus_summary = compute_corpus_summary(counts)
+    audience_metrics = compute_audience_metrics(counts)
+    content_type_metrics = compute_content_type_metrics(counts)
+    quality_metrics = compute_quality_metrics(counts)
+    gap_signals = compute_gap_signals(counts)
+    structural_observations = compute_structural_observations(counts)
+
+    # The metrics are computed here from validated models, hence we skip re-validating them.
+    return GapAnalysisInput.model_construct(
         corpus_summary=corpus_summary,
         audience_metrics=audience_metrics,
         content_type_metrics=content_type_metrics,
@@ -204,111 +323,285 @@ def generate_gap_analysis_input(
     )
 
 
-def compute_corpus_summary(
+class GapMetricsCounts:
+    """
+    Holds the raw counters of every gap analysis metric. These are gathered by
+    accumulate_gap_metrics and turned into the metrics by the compute_* functions.
+    """
+
+    def __init__(self) -> None:
+        self.total_articles: int = 0
+        self.total_collections: int = 0
+
+        # Corpus summary
+        self.articles_per_collection: Dict[str, int] = {}
+        self.articles_per_category: Dict[str, int] = {}
+        self.media_per_collection: Dict[str, int] = {}
+        self.media_per_category: Dict[str, int] = {}
+
+        # Audience
+        self.audience_distribution: Dict[
+            Literal["beginner", "intermediate", "advanced", "mixed"], int
+        ] = dict.fromkeys(_AUD_KEYS, 0)
+        self.audience_by_collection: Dict[
+            str, Dict[Literal["beginner", "intermediate", "advanced", "mixed"], int]
+        ] = {}
+        self.audience_by_category: Dict[
+            str, Dict[Literal["beginner", "intermediate", "advanced", "mixed"], int]
+        ] = {}
+
+        # Content type
+        self.content_type_distribution: Dict[
+            Literal[
+                "how-to", "conceptual", "faq", "reference", "troubleshooting", "mixed"
+            ],
+            int,
+        ] = dict.fromkeys(_CT_KEYS, 0)
+        self.content_type_by_collection: Dict[
+            str,
+            Dict[
+                Literal[
+                    "how-to",
+                    "conceptual",
+                    "faq",
+                    "reference",
+                    "troubleshooting",
+                    "mixed",
+                ],
+                int,
+            ],
+        ] = {}
+        self.content_type_by_category: Dict[
+            str,
+            Dict[
+                Literal[
+                    "how-to",
+                    "conceptual",
+                    "faq",
+                    "reference",
+                    "troubleshooting",
+                    "mixed",
+                ],
+                int,
+            ],
+        ] = {}
+
+        # Quality
+        self.quality_distribution: Dict[int, int] = dict.fromkeys(_Q_KEYS, 0)
+        self.quality_distribution_per_category: Dict[str, Dict[int, int]] = {}
+
+        # Gap signals
+        self.gaps_per_category: Dict[str, int] = {}
+        self.articles_with_gaps: int = 0
+        self.total_identified_gaps: int = 0
+
+        # Structural observations
+        self.audiences_in_collection: Dict[
+            str, Set[Literal["beginner", "intermediate", "advanced", "mixed"]]
+        ] = {}
+        self.audiences_in_category: Dict[
+            str, Set[Literal["beginner", "intermediate", "advanced", "mixed"]]
+        ] = {}
+        self.categories_with_one_or_less_article: List[str] = []
+
+
+def accumulate_gap_metrics(
     scraped_data: List[Collection], articles: List[ArticlesCatalogue]
-) -> CorpusSummary:
+) -> GapMetricsCounts:
     """
-    This function computes corpus summary from scraped data and articles catalogue.
+    This function gathers the counters of all the gap analysis metrics with a single
+    pass over the scraped data and a single pass over the articles catalogue.
 
     Args:
         scraped_data (List[Collection]): The entire scraped data.
         articles (List[ArticlesCatalogue]): The list of articles catalogue.
 
     Returns:
-        CorpusSummary: The computed corpus summary as object.
+        GapMetricsCounts: The gathered counters, to be finalized by the compute_* functions.
     """
 
-    # Init schema vars to be computed.
-    articles_per_collection: Dict[str, int] = {}
-    articles_per_category: Dict[str, int] = {}
-    media_per_collection: Dict[str, int] = {}
-    media_per_category: Dict[str, int] = {}
+    counts = GapMetricsCounts()
+    counts.total_articles = len(articles)
+    counts.total_collections = len(scraped_data)
 
     # Initialize dicts with collection and category keys and initial values using scraped data.
-    for collection in scraped_data:
-        articles_per_collection[collection.collection_title] = 0
-        media_per_collection[collection.collection_title] = 0
+    collection_titles = [collection.collection_title for collection in scraped_data]
+    categories = [category for _, category in _iter_categories(scraped_data)]
+    category_titles = [category.category_title for category in categories]
+
+    counts.articles_per_collection = dict.fromkeys(collection_titles, 0)
+    counts.media_per_collection = dict.fromkeys(collection_titles, 0)
+    counts.audience_by_collection = {
+        title: dict.fromkeys(_AUD_KEYS, 0) for title in collection_titles
+    }
+    counts.content_type_by_collection = {
+        title: dict.fromkeys(_CT_KEYS, 0) for title in collection_titles
+    }
+    counts.audiences_in_collection = {title: set() for title in collection_titles}
 
-        for category in collection.categories:
-            articles_per_category[category.category_title] = 0
-            media_per_category[category.category_title] = 0
-
-    # Update values.
-    for article in articles:
-        articles_per_collection[article.collection] += 1
-        articles_per_category[article.category] += 1
-
-        if article.has_screenshots or article.has_videos or article.has_tables:
-            media_per_collection[article.collection] += 1
-            media_per_category[article.category] += 1
-
-    return CorpusSummary(
-        total_articles=len(articles),
-        total_collections=len(scraped_data),
-        total_categories=len(articles_per_category),
-        articles_per_collection=articles_per_collection,
-        articles_per_category=articles_per_category,
+    counts.articles_per_category = dict.fromkeys(category_titles, 0)
+    counts.media_per_category = dict.fromkeys(category_titles, 0)
+    counts.audience_by_category = {
+        title: dict.fromkeys(_AUD_KEYS, 0) for title in category_titles
+    }
+    counts.content_type_by_category = {
+        title: dict.fromkeys(_CT_KEYS, 0) for title in category_titles
+    }
+    counts.quality_distribution_per_category = {
+        title: dict.fromkeys(_Q_KEYS, 0) for title in category_titles
+    }
+    counts.gaps_per_category = dict.fromkeys(category_titles, 0)
+    counts.audiences_in_category = {title: set() for title in category_titles}
+
+    # We also simply find which categories have one or less article. Note that we don't
+    # rely on scraped data for calculating metrics anywhere else because there is a good chance that
+    # not all articles are successfully analyzed during the Article Analysis phase and hence, those
+    # unanalyzed articles are bound to be cast off.
+    # In this case, it poses no issue, but instead, is a better approach as the scraped data can truly
+    # tell us the actual number of articles in categories/collections as scraping has lesser miss rate
+    # than LLM analysis.
+    counts.categories_with_one_or_less_article = [
+        category.category_title
+        for category in categories
+        if len(category.articles) <= 1
+    ]
+
+    # Read the fields the counters need off each article once, in a single pass, and
+    # transpose them into columns.
+    (
+        collection_col,
+        category_col,
+        audience_col,
+        content_type_col,
+        quality_score_col,
+        identified_gaps_col,
+        *media_flag_cols,
+    ) = (
+        zip(*map(_GAP_METRIC_FIELDS, articles))
+        if articles
+        else ((),) * len(_GAP_METRIC_FIELD_NAMES)
+    )
+    # Media refers to screenshots, videos or tables.
+    has_media_col = list(map(any, zip(*media_flag_cols)))
+
+    # Plain (and per group) occurrence counts are tallied by Counter in C, then added
+    # onto the dicts initialized above which fixes their keys and order.
+    _add_counts(counts.articles_per_collection, Counter(collection_col))
+    _add_counts(counts.articles_per_category, Counter(category_col))
+    _add_counts(
+        counts.media_per_collection, Counter(compress(collection_col, has_media_col))
+    )
+    _add_counts(
+        counts.media_per_category, Counter(compress(category_col, has_media_col))
+    )
+    _add_counts(counts.audience_distribution, Counter(audience_col))
+    collection_audience_counts = Counter(zip(collection_col, audience_col))
+    category_audience_counts = Counter(zip(category_col, audience_col))
+    _add_pair_counts(counts.audience_by_collection, collection_audience_counts)
+    _add_pair_counts(counts.audience_by_category, category_audience_counts)
+    _add_counts(counts.content_type_distribution, Counter(content_type_col))
+    _add_pair_counts(
+        counts.content_type_by_collection,
+        Counter(zip(collection_col, content_type_col)),
+    )
+    _add_pair_counts(
+        counts.content_type_by_category, Counter(zip(category_col, content_type_col))
+    )
+    _add_counts(counts.quality_distribution, Counter(quality_score_col))
+    _add_pair_counts(
+        counts.quality_distribution_per_category,
+        Counter(zip(category_col, quality_score_col)),
+    )
+
+    # Bind the remaining counters to locals, so the loop below doesn't go through
+    # the holder on every update.
+    gaps_per_category = counts.gaps_per_category
+    articles_with_gaps = 0
+    total_identified_gaps = 0
+
+    # Update the values which aren't plain counts.
+    for category, identified_gaps in zip(category_col, identified_gaps_col):
+        # Gap signals
+        gaps = len(identified_gaps)
+        gaps_per_category[category] += gaps
+        total_identified_gaps += gaps
+        if gaps > 0:
+            articles_with_gaps += 1
+
+    counts.articles_with_gaps = articles_with_gaps
+    counts.total_identified_gaps = total_identified_gaps
+
+    # Structural observations. The audiences present in each group are the distinct
+    # pairs counted above.
+    for collection, audience in collection_audience_counts:
+        counts.audiences_in_collection[collection].add(audience)
+    for category, audience in category_audience_counts:
+        counts.audiences_in_category[category].add(audience)
+
+    return counts
+
+
+def _add_counts(target: Dict, counts: Counter) -> None:
+    """
+    Adds the counts of each key onto the target dict. The keys must already be in it.
+    """
+
+    for key, count in counts.items():
+        target[key] += count
+
+
+def _add_pair_counts(target: Dict[str, Dict], counts: Counter) -> None:
+    """
+    Adds the counts of each (group, key) pair onto the nested target dict. The groups
+    and keys must already be in it.
+    """
+
+    for (group, key), count in counts.items():
+        target[group][key] += count
+
+
+def compute_corpus_summary(counts: GapMetricsCounts) -> CorpusSummary:
+    """
+    This function computes corpus summary from the gathered counters.
+
+    Args:
+        counts (GapMetricsCounts): The counters gathered from scraped data and articles catalogue.
+
+    Returns:
+        CorpusSummary: The computed corpus summary as object.
+    """
+
+    return CorpusSummary.model_construct(
+        total_articles=counts.total_articles,
+        total_collections=counts.total_collections,
+        total_categories=len(counts.articles_per_category),
+        articles_per_collection=counts.articles_per_collection,
+        articles_per_category=counts.articles_per_category,
         documentation_url=env_settings.SCRAPING_BASE_URL,
-        media_per_collection=media_per_collection,
-        media_per_category=media_per_category,
+        media_per_collection=counts.media_per_collection,
+        media_per_category=counts.media_per_category,
     )
 
 
-def compute_audience_metrics(
-    scraped_data: List[Collection], articles: List[ArticlesCatalogue]
-) -> AudienceMetrics:
+def compute_audience_metrics(counts: GapMetricsCounts) -> AudienceMetrics:
     """
-    This function computes audience metrics from scraped data and articles catalogue.
+    This function computes audience metrics from the gathered counters.
 
     Args:
-        scraped_data (List[Collection]): The entire scraped data.
-        articles (List[ArticlesCatalogue]): The list of articles catalogue.
+        counts (GapMetricsCounts): The counters gathered from scraped data and articles catalogue.
 
     Returns:
         AudienceMetrics: The computed audience metrics as object.
     """
 
-    # Init schema vars to be computed.
-    audience_distribution: Dict[
-        Literal["beginner", "intermediate", "advanced", "mixed"], int
-    ] = {"beginner": 0, "intermediate": 0, "advanced": 0, "mixed": 0}
-    audience_by_collection: Dict[
-        str, Dict[Literal["beginner", "intermediate", "advanced", "mixed"], int]
-    ] = {}
-    audience_by_category: Dict[
-        str, Dict[Literal["beginner", "intermediate", "advanced", "mixed"], int]
-    ] = {}
+    audience_distribution = counts.audience_distribution
     underserved_audiences: List[
         Literal["beginner", "intermediate", "advanced", "mixed"]
     ] = []
     progression_breaks_detected: bool = False
 
-    # Initialize dicts with collection and category keys and initial values using scraped data.
-    for collection in scraped_data:
-        audience_by_collection[collection.collection_title] = {
-            "beginner": 0,
-            "intermediate": 0,
-            "advanced": 0,
-            "mixed": 0,
-        }
-
-        for category in collection.categories:
-            audience_by_category[category.category_title] = {
-                "beginner": 0,
-                "intermediate": 0,
-                "advanced": 0,
-                "mixed": 0,
-            }
-
-    # Update values.
-    for article in articles:
-        audience_distribution[article.target_audience] += 1
-
-        audience_by_collection[article.collection][article.target_audience] += 1
-        audience_by_category[article.category][article.target_audience] += 1
-
     # Find progression breaks in categories.
-    for audience_dist in audience_by_category.values():
+    for audience_dist in counts.audience_by_category.values():
         # Note that mixed articles will be treated as beginner, intermediate, and advanced
         # and therefore there is no progression break.
         if audience_dist["mixed"] > 0:
@@ -330,7 +623,7 @@ def compute_audience_metrics(
     # - If advanced+mixed articles audience_distribution < 10% of total,
     #   the advanced audience can be considered underserved.
     #   We choose as low as 10% because advanced articles are naturally fewer.
-    total_articles = len(articles)
+    total_articles = counts.total_articles
     if (audience_distribution["beginner"] + audience_distribution["mixed"]) < (
         0.25 * total_articles
     ):
@@ -344,59 +637,26 @@ def compute_audience_metrics(
     ):
         underserved_audiences.append("advanced")
 
-    return AudienceMetrics(
+    return AudienceMetrics.model_construct(
         audience_distribution=audience_distribution,
-        audience_by_collection=audience_by_collection,
-        audience_by_category=audience_by_category,
+        audience_by_collection=counts.audience_by_collection,
+        audience_by_category=counts.audience_by_category,
         underserved_audiences=underserved_audiences,
         progression_breaks_detected=progression_breaks_detected,
     )
 
 
-def compute_content_type_metrics(
-    scraped_data: List[Collection], articles: List[ArticlesCatalogue]
-) -> ContentTypeMetrics:
+def compute_content_type_metrics(counts: GapMetricsCounts) -> ContentTypeMetrics:
     """
-    This function computes Content-Type metrics from scraped data and articles catalogue.
+    This function computes Content-Type metrics from the gathered counters.
 
     Args:
-        scraped_data (List[Collection]): The entire scraped data.
-        articles (List[ArticlesCatalogue]): The list of articles catalogue.
+        counts (GapMetricsCounts): The counters gathered from scraped data and articles catalogue.
 
     Returns:
         ContentTypeMetrics: The computed content type metrics as object.
     """
 
-    # Init schema vars to be computed.
-    content_type_distribution: Dict[
-        Literal["how-to", "conceptual", "faq", "reference", "troubleshooting", "mixed"],
-        int,
-    ] = {
-        "how-to": 0,
-        "conceptual": 0,
-        "faq": 0,
-        "reference": 0,
-        "troubleshooting": 0,
-        "mixed": 0,
-    }
-    content_type_by_collection: Dict[
-        str,
-        Dict[
-            Literal[
-                "how-to", "conceptual", "faq", "reference", "troubleshooting", "mixed"
-            ],
-            int,
-        ],
-    ] = {}
-    content_type_by_category: Dict[
-        str,
-        Dict[
-            Literal[
-                "how-to", "conceptual", "faq", "reference", "troubleshooting", "mixed"
-            ],
-            int,
-        ],
-    ] = {}
     missing_content_types_by_category: Dict[
         str,
         List[
@@ -406,260 +666,196 @@ def compute_content_type_metrics(
         ],
     ] = {}
 
-    # Initialize dicts with collection and category keys and initial values using scraped data.
-    for collection in scraped_data:
-        content_type_by_collection[collection.collection_title] = {
-            "how-to": 0,
-            "conceptual": 0,
-            "faq": 0,
-            "reference": 0,
-            "troubleshooting": 0,
-            "mixed": 0,
-        }
-
-        for category in collection.categories:
-            content_type_by_category[category.category_title] = {
-                "how-to": 0,
-                "conceptual": 0,
-                "faq": 0,
-                "reference": 0,
-                "troubleshooting": 0,
-                "mixed": 0,
-            }
-
-            missing_content_types_by_category[category.category_title] = []
-
-    # Update values.
-    for article in articles:
-        content_type_distribution[article.content_type] += 1
-
-        content_type_by_collection[article.collection][article.content_type] += 1
-        content_type_by_category[article.category][article.content_type] += 1
-
-    for category_key, category_value in content_type_by_category.items():
-        for content_type, count in category_value.items():
-            if count == 0:
-                missing_content_types_by_category[category_key].append(content_type)
-
-    return ContentTypeMetrics(
-        content_type_distribution=content_type_distribution,
-        content_type_by_collection=content_type_by_collection,
-        content_type_by_category=content_type_by_category,
+    for category_key, category_value in counts.content_type_by_category.items():
+        missing_content_types_by_category[category_key] = [
+            content_type
+            for content_type in _CT_KEYS
+            if category_value[content_type] == 0
+        ]
+
+    return ContentTypeMetrics.model_construct(
+        content_type_distribution=counts.content_type_distribution,
+        content_type_by_collection=counts.content_type_by_collection,
+        content_type_by_category=counts.content_type_by_category,
         missing_content_types_by_category=missing_content_types_by_category,
     )
 
 
-def compute_quality_metrics(
-    scraped_data: List[Collection], articles: List[ArticlesCatalogue]
-) -> QualityMetrics:
+def compute_quality_metrics(counts: GapMetricsCounts) -> QualityMetrics:
     """
-    This function computes Quality metrics from scraped data and articles catalogue.
+    This function computes Quality metrics from the gathered counters.
 
     Args:
-        scraped_data (List[Collection]): The entire scraped data.
-        articles (List[ArticlesCatalogue]): The list of articles catalogue.
+        counts (GapMetricsCounts): The counters gathered from scraped data and articles catalogue.
 
     Returns:
         QualityMetrics: The computed quality metrics as object.
     """
 
-    # Init schema vars to be computed.
-    average_quality_score: float = 0
-    quality_distribution: Dict[int, int] = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-    quality_distribution_per_category: Dict[str, Dict[int, int]] = {}
-    average_quality_per_category: Dict[str, float] = {}
-    low_quality_categories: List[str] = []
-
-    # Initialize dicts with category keys and initial values using scraped data.
-    for collection in scraped_data:
-        for category in collection.categories:
-            quality_distribution_per_category[category.category_title] = {
-                1: 0,
-                2: 0,
-                3: 0,
-                4: 0,
-                5: 0,
-            }
-            average_quality_per_category[category.category_title] = 0
-
-    # Compute quality distribution per category.
-    for article in articles:
-        quality_distribution_per_category[article.category][article.quality_score] += 1
-
-    # Calculate average quality score globally and for each category
-    total_score = 0
-    total_count = 0
-    for category, quality_distribution in quality_distribution_per_category.items():
-        # Average quality = Sum(quality * count) / Sum(count)
-        category_score = sum(
-            [score * count for score, count in quality_distribution.items()]
+    average_quality_score, average_quality_per_category, low_quality_categories = (
+        _finalize_quality(
+            counts.quality_distribution_per_category,
+            counts.articles_per_category,
+            counts.total_articles,
         )
-        category_count = sum(quality_distribution.values())
-
-        average_quality = category_score / category_count if category_count > 0 else 0
-        average_quality_per_category[category] = average_quality
-
-        total_score += category_score
-        total_count += category_count
-
-    # Compute global average quality score
-    average_quality_score = total_score / total_count if total_count > 0 else 0
-
-    # Find and store low quality categories
-    for category, average in average_quality_per_category.items():
-        if average < (average_quality_score - 0.5):
-            low_quality_categories.append(category)
+    )
 
-    return QualityMetrics(
+    return QualityMetrics.model_construct(
         average_quality_score=average_quality_score,
         average_quality_per_category=average_quality_per_category,
-        quality_distribution=quality_distribution,
-        quality_distribution_per_category=quality_distribution_per_category,
+        quality_distribution=counts.quality_distribution,
+        quality_distribution_per_category=counts.quality_distribution_per_category,
         low_quality_categories=low_quality_categories,
     )
 
 
-def compute_gap_signals(
-    scraped_data: List[Collection], articles: List[ArticlesCatalogue]
-) -> GapSignals:
+def compute_gap_signals(counts: GapMetricsCounts) -> GapSignals:
     """
-    This function computes Gap Signals metric from scraped data and articles catalogue.
+    This function computes Gap Signals metric from the gathered counters.
 
     Args:
-        scraped_data (List[Collection]): The entire scraped data.
-        articles (List[ArticlesCatalogue]): The list of articles catalogue.
+        counts (GapMetricsCounts): The counters gathered from scraped data and articles catalogue.
 
     Returns:
         GapSignals: The computed gap signals as object.
     """
 
-    # Init schema vars to be computed and helper vars.
-    gaps_per_category: Dict[str, int] = {}
-    articles_per_category: Dict[str, int] = {}
-    gap_density_per_category: Dict[str, float] = {}
-    categories_with_high_gap_density: List[str] = []
-    categories_with_low_gap_density: List[str] = []
-    articles_with_gaps: int = 0
-    total_identified_gaps: int = 0
-    average_gaps_per_article: float = 0
-
-    # Initialize dict with category keys and initial values using scraped data.
-    for collection in scraped_data:
-        for category in collection.categories:
-            gaps_per_category[category.category_title] = 0
-            gap_density_per_category[category.category_title] = 0
-            articles_per_category[category.category_title] = 0
-
-    # Update values.
-    for article in articles:
-        identified_gaps = len(article.identified_gaps)
-
-        gaps_per_category[article.category] += identified_gaps
-        total_identified_gaps += identified_gaps
-        articles_per_category[article.category] += 1
-        if identified_gaps > 0:
-            articles_with_gaps += 1
+    articles_with_gaps = counts.articles_with_gaps
+    total_identified_gaps = counts.total_identified_gaps
 
     # Total Identified Gaps / Number of articles with gaps
-    average_gaps_per_article = total_identified_gaps / articles_with_gaps if articles_with_gaps > 0 else 0
-
-    # Compute gap density across categories.
-    for category, gaps in gaps_per_category.items():
-        gap_density = gaps / articles_per_category[category] if articles_per_category[category] > 0 else 0
-
-        # Gap Density = Total Gaps in Category / Total Articles in Category
-        gap_density_per_category[category] = gap_density
+    average_gaps_per_article = (
+        total_identified_gaps / articles_with_gaps if articles_with_gaps > 0 else 0.0
+    )
 
-        # High Gap Density > 0.5, Low Gap Density <= 0.2
-        if gap_density > 0.5:
-            categories_with_high_gap_density.append(category)
-        elif gap_density <= 0.2:
-            categories_with_low_gap_density.append(category)
+    (
+        gap_density_per_category,
+        categories_with_high_gap_density,
+        categories_with_low_gap_density,
+    ) = _finalize_gaps(counts.gaps_per_category, counts.articles_per_category)
 
-    return GapSignals(
+    return GapSignals.model_construct(
         articles_with_gaps=articles_with_gaps,
         average_gaps_per_article=average_gaps_per_article,
         categories_with_high_gap_density=categories_with_high_gap_density,
         categories_with_low_gap_density=categories_with_low_gap_density,
         gap_density_per_category=gap_density_per_category,
-        gaps_per_category=gaps_per_category,
+        gaps_per_category=counts.gaps_per_category,
         total_identified_gaps=total_identified_gaps,
     )
 
 
-def compute_structural_observations(
-    scraped_data: List[Collection], articles: List[ArticlesCatalogue]
-) -> StructuralObservations:
+def _finalize_quality(
+    quality_distribution_per_category: Dict[str, Dict[int, int]],
+    articles_per_category: Dict[str, int],
+    total_articles: int,
+) -> Tuple[float, Dict[str, float], List[str]]:
+    """
+    Computes the global and per category average quality from the quality distributions,
+    along with the categories falling more than 0.5 below the global average.
+    """
+
+    average_quality_per_category: Dict[str, float] = {}
+
+    # Calculate average quality score globally and for each category
+    total_score = 0
+    for category, category_distribution in quality_distribution_per_category.items():
+        # Average quality = Sum(quality * count) / Sum(count), where the count of a
+        # category is simply its number of articles.
+        category_score = sum(
+            map(mul, category_distribution, category_distribution.values())
+        )
+        category_count = articles_per_category[category]
+
+        average_quality = category_score / category_count if category_count > 0 else 0.0
+        average_quality_per_category[category] = average_quality
+
+        total_score += category_score
+
+    # Compute global average quality score
+    average_quality_score = total_score / total_articles if total_articles > 0 else 0.0
+
+    # Find low quality categories
+    low_quality_threshold = average_quality_score - 0.5
+    low_quality_categories = [
+        category
+        for category, average in average_quality_per_category.items()
+        if average < low_quality_threshold
+    ]
+
+    return average_quality_score, average_quality_per_category, low_quality_categories
+
+
+def _finalize_gaps(
+    gaps_per_category: Dict[str, int], articles_per_category: Dict[str, int]
+) -> Tuple[Dict[str, float], List[str], List[str]]:
+    """
+    Computes the gap density of each category along with the categories of high and
+    low gap density.
+    """
+
+    # Gap Density = Total Gaps in Category / Total Articles in Category
+    gap_density_per_category: Dict[str, float] = {
+        category: gaps / articles_per_category[category]
+        if articles_per_category[category] > 0
+        else 0.0
+        for category, gaps in gaps_per_category.items()
+    }
+
+    # High Gap Density > 0.5, Low Gap Density <= 0.2
+    categories_with_high_gap_density = [
+        category
+        for category, gap_density in gap_density_per_category.items()
+        if gap_density > 0.5
+    ]
+    categories_with_low_gap_density = [
+        category
+        for category, gap_density in gap_density_per_category.items()
+        if gap_density <= 0.2
+    ]
+
+    return (
+        gap_density_per_category,
+        categories_with_high_gap_density,
+        categories_with_low_gap_density,
+    )
+
+
+def compute_structural_observations(counts: GapMetricsCounts) -> StructuralObservations:
     """
-    This function computes structural observations from scraped data and articles catalogue.
+    This function computes structural observations from the gathered counters.
 
     Args:
-        scraped_data (List[Collection]): The entire scraped data.
-        articles (List[ArticlesCatalogue]): The list of articles catalogue.
+        counts (GapMetricsCounts): The counters gathered from scraped data and articles catalogue.
 
     Returns:
         StructuralObservations: The computed structural observations as object.
     """
 
-    # Init schema vars to be computed and helper vars.
+    # Init schema vars to be computed.
     collections_with_no_beginner_content: List[str] = []
     collections_with_no_advanced_content: List[str] = []
     categories_with_no_beginner_content: List[str] = []
     categories_with_no_advanced_content: List[str] = []
-    categories_with_one_or_less_article: List[str] = []
-    content_type_by_collection: Dict[
-        str, List[Literal["beginner", "intermediate", "advanced", "mixed"]]
-    ] = {}
-    content_type_by_category: Dict[
-        str, List[Literal["beginner", "intermediate", "advanced", "mixed"]]
-    ] = {}
-
-    # Initialize dict with collection and category keys and initial values using scraped data.
-    for collection in scraped_data:
-        content_type_by_collection[collection.collection_title] = []
-
-        for category in collection.categories:
-            content_type_by_category[category.category_title] = []
-
-            # We also simply find which categories have one or less article. Note that we don't
-            # rely on scraped data for calculating metrics anywhere else because there is a good chance that
-            # not all articles are successfully analyzed during the Article Analysis phase and hence, those
-            # unanalyzed articles are bound to be cast off.
-            # In this case, it poses no issue, but instead, is a better approach as the scraped data can truly
-            # tell us the actual number of articles in categories/collections as scraping has lesser miss rate
-            # than LLM analysis.
-            if len(category.articles) <= 1:
-                categories_with_one_or_less_article.append(category.category_title)
-
-    # Update values.
-    for article in articles:
-        if (
-            article.target_audience
-            not in content_type_by_collection[article.collection]
-        ):
-            content_type_by_collection[article.collection].append(
-                article.target_audience
-            )
-        if article.target_audience not in content_type_by_category[article.category]:
-            content_type_by_category[article.category].append(article.target_audience)
 
     # Find the collections and categories with no beginner/advanced content.
-    for collection, audience in content_type_by_collection.items():
-        if "beginner" not in audience and "mixed" not in audience:
+    # Mixed articles serve every audience.
+    for collection, audience in counts.audiences_in_collection.items():
+        if not audience & _BEGINNER_AUDIENCES:
             collections_with_no_beginner_content.append(collection)
-        if "advanced" not in audience and "mixed" not in audience:
+        if not audience & _ADVANCED_AUDIENCES:
             collections_with_no_advanced_content.append(collection)
 
-    for category, audience in content_type_by_category.items():
-        if "beginner" not in audience and "mixed" not in audience:
+    for category, audience in counts.audiences_in_category.items():
+        if not audience & _BEGINNER_AUDIENCES:
             categories_with_no_beginner_content.append(category)
-        if "advanced" not in audience and "mixed" not in audience:
+        if not audience & _ADVANCED_AUDIENCES:
             categories_with_no_advanced_content.append(category)
 
-    return StructuralObservations(
+    return StructuralObservations.model_construct(
         collections_with_no_beginner_content=collections_with_no_beginner_content,
         collections_with_no_advanced_content=collections_with_no_advanced_content,
         categories_with_no_beginner_content=categories_with_no_beginner_content,
         categories_with_no_advanced_content=categories_with_no_advanced_content,
-        categories_with_one_or_less_article=categories_with_one_or_less_article,
+        categories_with_one_or_less_article=counts.categories_with_one_or_less_article,
     )
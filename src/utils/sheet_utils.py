@@ -5,131 +5,195 @@ from ..models.analysis_schema import (
     GapAnalysisResult,
 )
 
+# The flatten_* functions below read the fields straight off the models' instance dicts,
+# then build each spreadsheet column with its own comprehension.
+
+# Spreadsheet columns of each flattened table, in display order.
+_ARTICLE_COLUMNS = (
+    "Article ID",
+    "Article Title",
+    "Collection",
+    "Category",
+    "URL",
+    "Content Type",
+    "Topics Covered",
+    "Gaps Identified",
+    "Quality Score",
+    "Target Audience",
+    "Last Updated",
+    "Word Count",
+    "Has Screenshots",
+    "Has Videos",
+    "Has Tables",
+)
+_GAP_COLUMNS = (
+    "Gap ID",
+    "Gap Title",
+    "Gap Description",
+    "Category",
+    "Collection",
+    "Priority",
+    "Affected Audience",
+    "Evidence",
+    "Recommendation",
+    "Related Topics",
+    "Rationale",
+    "Suggested Article Title",
+)
+_COMPARISON_COLUMNS = (
+    "Competitor Name",
+    "Docs URL",
+    "Docs Strengths",
+    "Docs Weaknesses",
+    "Onboarding Coverage",
+    "Advanced Feature Coverage",
+    "Docs Structure",
+    "Notable Documentation Patterns",
+    "Confidence Score",
+)
+_INSIGHT_COLUMNS = (
+    "Insight Type",
+    "Insight Summary",
+    "Detailed Observation",
+    "Evidence",
+    "Impact Level",
+    "Recommended Action",
+    "Confidence Score",
+)
 
-def flatten_articles_catalogue(articles: List[ArticlesCatalogue]) -> List[Dict]:
+# Prefix of each item of a bulleted cell.
+_BULLET = "• "
+# Cell text of a boolean flag, indexed by the flag itself (False -> 0, True -> 1).
+_YESNO = ("❌ No", "✅ Yes")
+# HYPERLINK formulas of the article and competitor docs URLs.
+_ARTICLE_LINK = '=HYPERLINK("%s", "Article Link")'
+_DOCS_LINK = '=HYPERLINK("%s", "Docs Link")'
+# Display labels of competitor insight types.
+_INSIGHT_LABELS = {
+    "zipboard_gap": "Gap",
+    "zipboard_advantage": "Advantage",
+    "industry_expectation": "Industry Expectation",
+    "docs_opportunity": "Opportunity",
+}
+# Title-cased values of the enum-like columns, which only take a handful of distinct values.
+_title_cache: Dict[str, str] = {}
+
+
+def flatten_articles_catalogue(articles: List[ArticlesCatalogue]) -> Dict[str, List]:
     """
-    This function flattens ArticlesCatalogue data into a list of dictionaries
-    suitable for spreadsheet representation.
+    This function flattens ArticlesCatalogue data column-wise, i.e., into a dict
+    mapping each spreadsheet column to the list of its values.
     """
 
-    flattended_data: List[Dict] = []
-
-    for article in articles:
-        flattended_data.append(
-            {
-                "Article ID": article.article_id,
-                "Article Title": article.article_title,
-                "Collection": article.collection,
-                "Category": article.category,
-                "URL": f'=HYPERLINK("{article.url}", "Article Link")',
-                "Content Type": article.content_type.title(),
-                "Topics Covered": "\n".join(
-                    f"• {item}" for item in article.topics_covered
-                ),
-                "Gaps Identified": "\n".join(
-                    f"• {item}" for item in article.identified_gaps
-                ),
-                "Quality Score": article.quality_score,
-                "Target Audience": article.target_audience.title(),
-                "Last Updated": article.last_updated,
-                "Word Count": article.word_count,
-                "Has Screenshots": "✅ Yes" if article.has_screenshots else "❌ No",
-                "Has Videos": "✅ Yes" if article.has_videos else "❌ No",
-                "Has Tables": "✅ Yes" if article.has_tables else "❌ No",
-            }
+    rows = [article.__dict__ for article in articles]
+
+    return dict(
+        zip(
+            _ARTICLE_COLUMNS,
+            (
+                [fields["article_id"] for fields in rows],
+                [fields["article_title"] for fields in rows],
+                [fields["collection"] for fields in rows],
+                [fields["category"] for fields in rows],
+                [_ARTICLE_LINK % fields["url"] for fields in rows],
+                [_title(fields["content_type"]) for fields in rows],
+                [_bullets(fields["topics_covered"]) for fields in rows],
+                [_bullets(fields["identified_gaps"]) for fields in rows],
+                [fields["quality_score"] for fields in rows],
+                [_title(fields["target_audience"]) for fields in rows],
+                [fields["last_updated"] for fields in rows],
+                [fields["word_count"] for fields in rows],
+                [_YESNO[fields["has_screenshots"]] for fields in rows],
+                [_YESNO[fields["has_videos"]] for fields in rows],
+                [_YESNO[fields["has_tables"]] for fields in rows],
+            ),
         )
-
-    return flattended_data
+    )
 
 
-def flatten_gap_analysis_result(analysis_data: List[GapAnalysisResult]) -> List[Dict]:
+def flatten_gap_analysis_result(
+    analysis_data: List[GapAnalysisResult],
+) -> Dict[str, List]:
     """
-    This function flattens GapAnalysisResult data into a list of dictionaries.
+    This function flattens GapAnalysisResult data column-wise into a dict of column lists.
     """
 
-    flattened_data: List[Dict] = []
-
-    for gap in analysis_data:
-        flattened_data.append(
-            {
-                "Gap ID": gap.gap_id,
-                "Gap Title": gap.analysis.gap_title,
-                "Gap Description": gap.analysis.gap_description,
-                "Category": gap.analysis.category,
-                "Collection": gap.analysis.collection,
-                "Priority": gap.analysis.priority.title(),
-                "Affected Audience": gap.analysis.affected_audience.title(),
-                "Evidence": "\n".join(f"• {item}" for item in gap.analysis.evidence),
-                "Recommendation": gap.analysis.recommendation,
-                "Related Topics": "\n".join(
-                    f"• {item}" for item in gap.analysis.related_topics
-                ),
-                "Rationale": gap.analysis.rationale,
-                "Suggested Article Title": gap.analysis.suggested_article_title,
-            }
+    rows = [gap.__dict__ for gap in analysis_data]
+    analyses = [fields["analysis"].__dict__ for fields in rows]
+
+    return dict(
+        zip(
+            _GAP_COLUMNS,
+            (
+                [fields["gap_id"] for fields in rows],
+                [analysis["gap_title"] for analysis in analyses],
+                [analysis["gap_description"] for analysis in analyses],
+                [analysis["category"] for analysis in analyses],
+                [analysis["collection"] for analysis in analyses],
+                [_title(analysis["priority"]) for analysis in analyses],
+                [_title(analysis["affected_audience"]) for analysis in analyses],
+                [_bullets(analysis["evidence"]) for analysis in analyses],
+                [analysis["recommendation"] for analysis in analyses],
+                [_bullets(analysis["related_topics"]) for analysis in analyses],
+                [analysis["rationale"] for analysis in analyses],
+                [analysis["suggested_article_title"] for analysis in analyses],
+            ),
         )
-
-    return flattened_data
+    )
 
 
 def flatten_competitor_comparison(
     analysis_data: CompetitorAnalysisOutput,
-) -> List[Dict]:
+) -> Dict[str, List]:
     """
     This function extracts the competitor comparison data from analysis data
-    and flattens it into a list of dict.
+    and flattens it column-wise into a dict of column lists.
     """
 
-    flattened_data: List[Dict] = []
-
-    for data in analysis_data.competitor_comparisons:
-        flattened_data.append(
-            {
-                "Competitor Name": data.competitor_name,
-                "Docs URL": f'=HYPERLINK("{data.docs_url}", "Docs Link")',
-                "Docs Strengths": "\n".join(
-                    f"• {item}" for item in data.docs_strengths
-                ),
-                "Docs Weaknesses": "\n".join(
-                    f"• {item}" for item in data.docs_weaknesses
-                ),
-                "Onboarding Coverage": data.onboarding_coverage.title(),
-                "Advanced Feature Coverage": data.advanced_feature_coverage.title(),
-                "Docs Structure": data.docs_structure.title(),
-                "Notable Documentation Patterns": "\n".join(
-                    f"• {item}" for item in data.notable_docs_patterns
-                ),
-                "Confidence Score": data.confidence_score,
-            }
+    rows = [data.__dict__ for data in analysis_data.competitor_comparisons]
+
+    return dict(
+        zip(
+            _COMPARISON_COLUMNS,
+            (
+                [fields["competitor_name"] for fields in rows],
+                [_DOCS_LINK % fields["docs_url"] for fields in rows],
+                [_bullets(fields["docs_strengths"]) for fields in rows],
+                [_bullets(fields["docs_weaknesses"]) for fields in rows],
+                [_title(fields["onboarding_coverage"]) for fields in rows],
+                [_title(fields["advanced_feature_coverage"]) for fields in rows],
+                [_title(fields["docs_structure"]) for fields in rows],
+                [_bullets(fields["notable_docs_patterns"]) for fields in rows],
+                [fields["confidence_score"] for fields in rows],
+            ),
         )
-
-    return flattened_data
+    )
 
 
 def flatten_competitor_analysis_insights(
     analysis_data: CompetitorAnalysisOutput,
-) -> List[Dict]:
+) -> Dict[str, List]:
     """
     This function extracts the competitor analysis insights data from analysis data
-    and flattens it into a list of dict.
+    and flattens it column-wise into a dict of column lists.
     """
 
-    flattened_data: List[Dict] = []
-
-    for data in analysis_data.competitor_insights:
-        flattened_data.append(
-            {
-                "Insight Type": format_insight_type(data.insight_type),
-                "Insight Summary": data.insight_summary,
-                "Detailed Observation": data.detailed_observation,
-                "Evidence": data.evidence,
-                "Impact Level": data.impact_level.title(),
-                "Recommended Action": data.recommended_action,
-                "Confidence Score": data.confidence_score,
-            }
+    rows = [data.__dict__ for data in analysis_data.competitor_insights]
+
+    return dict(
+        zip(
+            _INSIGHT_COLUMNS,
+            (
+                [format_insight_type(fields["insight_type"]) for fields in rows],
+                [fields["insight_summary"] for fields in rows],
+                [fields["detailed_observation"] for fields in rows],
+                [fields["evidence"] for fields in rows],
+                [_title(fields["impact_level"]) for fields in rows],
+                [fields["recommended_action"] for fields in rows],
+                [fields["confidence_score"] for fields in rows],
+            ),
         )
-
-    return flattened_data
+    )
 
 
 def format_insight_type(
@@ -137,11 +201,27 @@ def format_insight_type(
         "zipboard_gap", "zipboard_advantage", "industry_expectation", "docs_opportunity"
     ],
 ) -> str:
-    if insight_type == "zipboard_gap":
-        return "Gap"
-    elif insight_type == "zipboard_advantage":
-        return "Advantage"
-    elif insight_type == "industry_expectation":
-        return "Industry Expectation"
-    else:
-        return "Opportunity"
+    return _INSIGHT_LABELS.get(insight_type, "Opportunity")
+
+
+def _bullets(items: List[str]) -> str:
+    """
+    Formats the items as a bulleted list, one per line, for a single cell.
+    """
+
+    if not items:
+        return ""
+
+    return "\n".join([_BULLET + item for item in items])
+
+
+def _title(value: str) -> str:
+    """
+    Returns the title-cased value, computing it only on the first occurrence of the value.
+    """
+
+    titled = _title_cache.get(value)
+    if titled is None:
+        titled = _title_cache.setdefault(value, value.title())
+
+    return titled